@@ -2,27 +2,39 @@ from __future__ import annotations
 
 import argparse
 import csv
+import json
+import re
 import sys
-from typing import NamedTuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple
 
 from kubernetes import client, config
+from kubernetes.client import ApiException
+from kubernetes.utils.quantity import parse_quantity
 from rich import box
-from rich.color import Color, ColorType, blend_rgb, parse_rgb_hex
+from rich.color import Color, blend_rgb, parse_rgb_hex
 from rich.console import Console
 from rich.style import Style
 from rich.table import Column, Table
 from rich.text import Text
+from urllib3.exceptions import HTTPError
 
 from sefcom_clusterutils import print_version
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class TableRow(NamedTuple):
     namespace: str
-    cpu_request: float
+    cpu_request: int
     cpu_request_percent: float
-    cpu_limit: float
+    cpu_limit: int
     cpu_limit_percent: float
-    cpu_usage: float
+    cpu_usage: int
     cpu_usage_percent: float
     mem_request: int
     mem_request_percent: float
@@ -36,326 +48,364 @@ class TableRow(NamedTuple):
     storage_limit_percent: float
 
 
-def parse_cpu(size_str: str, fallback_unit: str | None) -> int:
+# Binary byte units
+_KB = 1 << 10
+_MB = 1 << 20
+_GB = 1 << 30
+_TB = 1 << 40
+_PB = 1 << 50
+
+
+# Quantity strings repeat heavily across containers ("100m", "128Mi", ...), so
+# each distinct string is only parsed once per run
+@lru_cache(maxsize=None)
+def parse_cpu(size_str: str) -> int:
     """Emits in nanocores."""
     if not size_str:
         return 0
 
-    size_str = size_str.strip()
-    size = int("".join(filter(str.isdigit, size_str)))
-
-    if size == 0:
-        result = 0
-    elif size_str.endswith("m"):
-        result = size * 10**6
-    elif size_str.endswith("u"):
-        result = size * 10**3
-    elif size_str.endswith("n"):
-        result = size
-    elif fallback_unit == "m":
-        result = size * 10**6
-    elif fallback_unit == "u":
-        result = size * 10**3
-    elif fallback_unit == "n":
-        result = size
-    elif fallback_unit == "unit":
-        result = size * 10**9
-    else:
-        msg = f"CPU unit unknown for string {size_str}"
-        raise Exception(msg)
-
-    return result
+    return int(parse_quantity(size_str) * 10**9)
 
 
-def parse_memory(size_str: str, fallback_unit: str | None = None) -> int:
+@lru_cache(maxsize=None)
+def parse_memory(size_str: str) -> int:
+    """Emits in bytes."""
     if not size_str:
         return 0
 
-    size_str = size_str.strip()
-    size = float("".join(filter(str.isdigit, size_str)))
-
-    if size_str.endswith(("G", "Gi", "g", "gi")):
-        result = int(size * pow(1024, 3))
-    elif size_str.endswith(("M", "Mi", "m", "mi")):
-        result = int(size * pow(1024, 2))
-    elif size_str.endswith(("K", "Ki", "k", "ki")):
-        result = int(size * 1024)
-    elif fallback_unit == "g":
-        result = int(size * pow(1024, 3))
-    elif fallback_unit == "m":
-        result = int(size * pow(1024, 2))
-    elif fallback_unit == "k":
-        result = int(size * 1024)
-    elif fallback_unit == "b":
-        result = int(size)
-    else:
-        msg = f"Memory unit unknown for string {size_str}"
-        raise Exception(msg)
+    return int(parse_quantity(size_str))
 
-    return result
 
+# Stand-in for containers without requests or limits; never mutated
+_EMPTY: dict[str, str] = {}
 
-def get_summary_pod_resources() -> dict[str, dict[str, int]]:
-    config.load_kube_config()
-    v1 = client.CoreV1Api()
 
-    resources: dict[str, dict[str, int]] = {}
-    pods = v1.list_pod_for_all_namespaces(
+def _new_resource_dict() -> dict[str, int]:
+    return {
+        "cpu_request": 0,
+        "cpu_limit": 0,
+        "mem_request": 0,
+        "mem_limit": 0,
+        "storage_request": 0,
+        "storage_limit": 0,
+    }
+
+
+def _iter_pod_resource_specs(
+    v1: client.CoreV1Api,
+) -> Iterator[tuple[str, dict[str, str], dict[str, str]]]:
+    """Yields (namespace, requests, limits) for every container of running pods.
+
+    The response is decoded as plain JSON instead of being deserialized into
+    V1Pod models, and is served from the apiserver watch cache.
+    """
+    response = v1.list_pod_for_all_namespaces(
         field_selector="status.phase=Running",
+        resource_version="0",
+        resource_version_match="NotOlderThan",
         watch=False,
+        _preload_content=False,
     )
-
-    for i in pods.items:
-        namespace = i.metadata.namespace
-        if not i.spec.containers:
-            continue
-        for container in i.spec.containers:
-            if not container.resources:
+    try:
+        pods = json.loads(response.data)
+    finally:
+        response.release_conn()
+
+    for pod in pods["items"]:
+        namespace = pod["metadata"]["namespace"]
+        for container in pod["spec"].get("containers") or []:
+            container_resources = container.get("resources")
+            if not container_resources:
                 continue
-            resource_dict = resources.get(
+            yield (
                 namespace,
-                {
-                    "cpu_request": 0,
-                    "cpu_limit": 0,
-                    "mem_request": 0,
-                    "mem_limit": 0,
-                    "storage_request": 0,
-                    "storage_limit": 0,
-                },
+                container_resources.get("requests") or _EMPTY,
+                container_resources.get("limits") or _EMPTY,
             )
 
-            cpu_request = (
-                container.resources.requests.get("cpu")
-                if container.resources.requests
-                else None
-            )
-            cpu_limit = (
-                container.resources.limits.get("cpu")
-                if container.resources.limits
-                else None
-            )
-            mem_request = (
-                container.resources.requests.get("memory")
-                if container.resources.requests
-                else None
-            )
-            mem_limit = (
-                container.resources.limits.get("memory")
-                if container.resources.limits
-                else None
-            )
-            storage_request = (
-                container.resources.requests.get("ephemeral-storage")
-                if container.resources.requests
-                else None
-            )
-            storage_limit = (
-                container.resources.limits.get("ephemeral-storage")
-                if container.resources.limits
-                else None
-            )
 
-            resource_dict["cpu_request"] += (
-                parse_cpu(cpu_request, fallback_unit="unit") if cpu_request else 0
-            )
-            resource_dict["cpu_limit"] += (
-                parse_cpu(cpu_limit, fallback_unit="unit") if cpu_limit else 0
-            )
-            resource_dict["mem_request"] += (
-                parse_memory(mem_request) if mem_request else 0
-            )
-            resource_dict["mem_limit"] += parse_memory(mem_limit) if mem_limit else 0
-            resource_dict["storage_request"] += (
-                parse_memory(storage_request) if storage_request else 0
-            )
-            resource_dict["storage_limit"] += (
-                parse_memory(storage_limit) if storage_limit else 0
-            )
+def get_summary_pod_resources(v1: client.CoreV1Api) -> dict[str, dict[str, int]]:
+    resources: dict[str, dict[str, int]] = defaultdict(_new_resource_dict)
 
-            resources[namespace] = resource_dict
+    for namespace, requests, limits in _iter_pod_resource_specs(v1):
+        resource_dict = resources[namespace]
 
-    return resources
+        # Missing quantities are "" and parse to 0
+        resource_dict["cpu_request"] += parse_cpu(requests.get("cpu", ""))
+        resource_dict["cpu_limit"] += parse_cpu(limits.get("cpu", ""))
+        resource_dict["mem_request"] += parse_memory(requests.get("memory", ""))
+        resource_dict["mem_limit"] += parse_memory(limits.get("memory", ""))
+        resource_dict["storage_request"] += parse_memory(
+            requests.get("ephemeral-storage", ""),
+        )
+        resource_dict["storage_limit"] += parse_memory(
+            limits.get("ephemeral-storage", ""),
+        )
 
+    return resources
 
-def get_pod_metrics() -> dict[str, dict[str, int]]:
-    config.load_kube_config()
-    api = client.CustomObjectsApi()
 
+def get_pod_metrics(api: client.CustomObjectsApi) -> dict[str, dict[str, int]]:
     metrics = api.list_cluster_custom_object("metrics.k8s.io", "v1beta1", "pods")
 
-    all_metrics: dict[str, dict[str, int]] = {}
+    all_metrics: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"cpu_usage": 0, "mem_usage": 0},
+    )
 
     for item in metrics["items"]:
         ns_name = item["metadata"]["namespace"]
 
-        ns_metrics = all_metrics.get(
-            ns_name,
-            {"cpu_usage": 0, "mem_usage": 0},
-        )
+        ns_metrics = all_metrics[ns_name]
 
         for container in item["containers"]:
-            ns_metrics["cpu_usage"] += parse_cpu(
-                container["usage"]["cpu"],
-                fallback_unit="n",
-            )
+            ns_metrics["cpu_usage"] += parse_cpu(container["usage"]["cpu"])
             ns_metrics["mem_usage"] += parse_memory(container["usage"]["memory"])
 
-        all_metrics[ns_name] = ns_metrics
-
     return all_metrics
 
 
-def get_cluster_capacity() -> dict[str, int]:
-    config.load_kube_config()
-    v1 = client.CoreV1Api()
-
+def get_cluster_capacity(v1: client.CoreV1Api) -> dict[str, int]:
     nodes = v1.list_node()
     total_capacity = {"cpu": 0, "memory": 0, "storage": 0}
 
     for node in nodes.items:
-        total_capacity["cpu"] += parse_cpu(
-            node.status.capacity.get("cpu", "0"),
-            fallback_unit="unit",
-        )
+        total_capacity["cpu"] += parse_cpu(node.status.capacity.get("cpu", "0"))
         total_capacity["memory"] += parse_memory(
             node.status.capacity.get("memory", "0"),
-            fallback_unit="b",
         )
         total_capacity["storage"] += parse_memory(
             node.status.capacity.get("ephemeral-storage", "0"),
-            fallback_unit="b",
         )
 
     return total_capacity
 
 
-def format_cpu(cpu: float) -> Text:
+_KSM_SAMPLE_RE = re.compile(r"([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)")
+_KSM_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+# kube-state-metrics resource label -> (request key, limit key, capacity key)
+_KSM_RESOURCES = {
+    "cpu": ("cpu_request", "cpu_limit", "cpu"),
+    "memory": ("mem_request", "mem_limit", "memory"),
+    "ephemeral_storage": ("storage_request", "storage_limit", "storage"),
+}
+_KSM_FAMILIES = {
+    "kube_pod_status_phase",
+    "kube_pod_container_resource_requests",
+    "kube_pod_container_resource_limits",
+    "kube_node_status_capacity",
+}
+
+
+def _iter_ksm_samples(text: str) -> Iterator[tuple[str, dict[str, str], float]]:
+    """Yields (name, labels, value) for the samples this tool consumes."""
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _KSM_SAMPLE_RE.match(line)
+        if match is None or match.group(1) not in _KSM_FAMILIES:
+            continue
+        labels = dict(_KSM_LABEL_RE.findall(match.group(2) or ""))
+        yield match.group(1), labels, float(match.group(3))
+
+
+def get_ksm_summary(
+    v1: client.CoreV1Api,
+    service: str,
+) -> tuple[dict[str, dict[str, int]], dict[str, int]]:
+    """Reads pod resources and node capacity from kube-state-metrics.
+
+    The metrics endpoint is reached through the apiserver service proxy, so no
+    port-forward is needed. Returns the same shapes as get_summary_pod_resources
+    and get_cluster_capacity.
+    """
+    namespace, _, name = service.rpartition("/")
+    response = v1.connect_get_namespaced_service_proxy_with_path(
+        name,
+        namespace or "kube-system",
+        "metrics",
+        _preload_content=False,
+    )
+    try:
+        text = response.data.decode()
+    finally:
+        response.release_conn()
+
+    running: set[tuple[str, str]] = set()
+    container_samples: list[tuple[tuple[str, str], str, int]] = []
+    total_capacity = {"cpu": 0, "memory": 0, "storage": 0}
+
+    for family, labels, value in _iter_ksm_samples(text):
+        if family == "kube_pod_status_phase":
+            if labels.get("phase") == "Running" and value:
+                running.add((labels["namespace"], labels["pod"]))
+            continue
+
+        keys = _KSM_RESOURCES.get(labels.get("resource", ""))
+        if keys is None:
+            continue
+        # CPU is reported in cores, everything else in bytes
+        amount = round(value * 10**9) if labels["resource"] == "cpu" else round(value)
+
+        if family == "kube_node_status_capacity":
+            total_capacity[keys[2]] += amount
+        elif family == "kube_pod_container_resource_requests":
+            pod = (labels["namespace"], labels["pod"])
+            container_samples.append((pod, keys[0], amount))
+        else:
+            pod = (labels["namespace"], labels["pod"])
+            container_samples.append((pod, keys[1], amount))
+
+    resources: dict[str, dict[str, int]] = defaultdict(_new_resource_dict)
+    for pod, key, amount in container_samples:
+        if pod in running:
+            resources[pod[0]][key] += amount
+
+    return resources, total_capacity
+
+
+def format_cpu(cpu: int) -> Text:
     """Format CPU resource value."""
     mcpu_divide_threshold = 1000
 
-    cpu = cpu / (10**6)
+    mcpu = cpu / (10**6)
 
-    if cpu >= mcpu_divide_threshold:
-        return Text(f"{cpu / 1000:.2f} CPU")
+    if mcpu >= mcpu_divide_threshold:
+        return Text(f"{mcpu / 1000:.2f} CPU")
 
-    return Text(f"{cpu:.2f} mCPU")
+    return Text(f"{mcpu:.2f} mCPU")
 
 
 def format_mem(num_bytes: int) -> Text:
     """Takes in bytes, returns in formatted unit."""
-    bytes_base = 1024
-
-    if num_bytes < bytes_base:  # Bytes
+    if num_bytes < _KB:
         result = f"{num_bytes:.2f} B"
-    elif num_bytes < bytes_base * 2:  # KB
-        result = f"{num_bytes / bytes_base:.2f} KB"
-    elif num_bytes < bytes_base * 3:  # MB
-        result = f"{num_bytes / (bytes_base*2):.2f} MB"
-    elif num_bytes < bytes_base * 4:  # GB
-        result = f"{num_bytes / (1024**3):.2f} GB"
-    else:  # TB
-        result = f"{num_bytes / (1024**4):.2f} TB"
+    elif num_bytes < _MB:
+        result = f"{num_bytes / _KB:.2f} KB"
+    elif num_bytes < _GB:
+        result = f"{num_bytes / _MB:.2f} MB"
+    elif num_bytes < _TB:
+        result = f"{num_bytes / _GB:.2f} GB"
+    elif num_bytes < _PB:
+        result = f"{num_bytes / _TB:.2f} TB"
+    else:
+        result = f"{num_bytes / _PB:.2f} PB"
 
     return Text(result)
 
 
+# Shared, read-only default for namespaces without metrics
+_NO_METRICS = {"cpu_usage": 0, "mem_usage": 0}
+
+
+def _percent_scale(capacity: int) -> float:
+    """Factor turning a raw amount into a percent of capacity."""
+    return 100 / capacity if capacity else 0.0
+
+
 def build_table(
     resources: dict[str, dict[str, int]],
     metrics: dict[str, dict[str, int]],
     total_capacity: dict[str, int],
 ) -> list[TableRow]:
     table: list[TableRow] = []
+    cpu_scale = _percent_scale(total_capacity["cpu"])
+    mem_scale = _percent_scale(total_capacity["memory"])
+    storage_scale = _percent_scale(total_capacity["storage"])
 
     for namespace, resource_dict in resources.items():
-        metric_dict = metrics.get(
-            namespace,
-            {"cpu_usage": 0, "mem_usage": 0},
-        )
+        metric_dict = metrics.get(namespace, _NO_METRICS)
 
         row = TableRow(
             namespace,
             resource_dict["cpu_request"],
-            resource_dict["cpu_request"] / total_capacity["cpu"] * 100,
+            resource_dict["cpu_request"] * cpu_scale,
             resource_dict["cpu_limit"],
-            resource_dict["cpu_limit"] / total_capacity["cpu"] * 100,
+            resource_dict["cpu_limit"] * cpu_scale,
             metric_dict["cpu_usage"],
-            metric_dict["cpu_usage"] / total_capacity["cpu"] * 100,
+            metric_dict["cpu_usage"] * cpu_scale,
             resource_dict["mem_request"],
-            resource_dict["mem_request"] / total_capacity["memory"] * 100,
+            resource_dict["mem_request"] * mem_scale,
             resource_dict["mem_limit"],
-            resource_dict["mem_limit"] / total_capacity["memory"] * 100,
+            resource_dict["mem_limit"] * mem_scale,
             metric_dict["mem_usage"],
-            metric_dict["mem_usage"] / total_capacity["memory"] * 100,
+            metric_dict["mem_usage"] * mem_scale,
             resource_dict["storage_request"],
-            resource_dict["storage_request"] / total_capacity["storage"] * 100,
+            resource_dict["storage_request"] * storage_scale,
             resource_dict["storage_limit"],
-            resource_dict["storage_limit"] / total_capacity["storage"] * 100,
+            resource_dict["storage_limit"] * storage_scale,
         )
         table.append(row)
 
     return table
 
 
+# Mapping from --sort-by values (and their aliases) to TableRow attributes
+_SORT_KEYS = {
+    alias: attrgetter(field)
+    for field, aliases in (
+        ("namespace", ("name", "n")),
+        ("cpu_request", ("cpu-request", "cr")),
+        ("cpu_limit", ("cpu-limit", "cl")),
+        ("cpu_usage", ("cpu-usage", "cu")),
+        ("mem_request", ("mem-request", "mr")),
+        ("mem_limit", ("mem-limit", "ml")),
+        ("mem_usage", ("mem-usage", "mu")),
+        ("storage_request", ("storage-request", "sr")),
+        ("storage_limit", ("storage-limit", "sl")),
+    )
+    for alias in aliases
+}
+
+
 def sort_table(table: list[TableRow], sort_key: str) -> list[TableRow]:
     """Sorts the table rows based on the provided sort_key."""
-    # Define a mapping from sort_key strings to TableRow attributes
-    key_mapping = {
-        "name": lambda row: row.namespace,
-        "cpu-request": lambda row: row.cpu_request,
-        "cpu-limit": lambda row: row.cpu_limit,
-        "cpu-usage": lambda row: row.cpu_usage,
-        "mem-request": lambda row: row.mem_request,
-        "mem-limit": lambda row: row.mem_limit,
-        "mem-usage": lambda row: row.mem_usage,
-        "storage-request": lambda row: row.storage_request,
-        "storage-limit": lambda row: row.storage_limit,
-        "n": lambda row: row.namespace,
-        "cr": lambda row: row.cpu_request,
-        "cl": lambda row: row.cpu_limit,
-        "cu": lambda row: row.cpu_usage,
-        "mr": lambda row: row.mem_request,
-        "ml": lambda row: row.mem_limit,
-        "mu": lambda row: row.mem_usage,
-        "sr": lambda row: row.storage_request,
-        "sl": lambda row: row.storage_limit,
-    }
-
-    # Ensure the provided sort_key is valid
-    if sort_key not in key_mapping:
-        sort_key = "name"
+    # Unknown or missing keys sort by name
+    return sorted(table, key=_SORT_KEYS.get(sort_key, _SORT_KEYS["name"]))
 
-    # Sort the table using the selected key
-    return sorted(table, key=key_mapping[sort_key])
 
+def add_total_row(
+    table: list[TableRow],
+    total_capacity: dict[str, int],
+) -> list[TableRow]:
+    cpu_request = cpu_limit = cpu_usage = 0
+    mem_request = mem_limit = mem_usage = 0
+    storage_request = storage_limit = 0
 
-def add_total_row(table: list[TableRow]) -> list[TableRow]:
-    total_cpu_request = sum(row.cpu_request for row in table)
-    total_cpu_limit = sum(row.cpu_limit for row in table)
-    total_cpu_usage = sum(row.cpu_usage for row in table)
-    total_mem_request = sum(row.mem_request for row in table)
-    total_mem_limit = sum(row.mem_limit for row in table)
-    total_mem_usage = sum(row.mem_usage for row in table)
-    total_storage_request = sum(row.storage_request for row in table)
-    total_storage_limit = sum(row.storage_limit for row in table)
+    # Accumulate every raw column in a single pass over the table
+    for row in table:
+        cpu_request += row.cpu_request
+        cpu_limit += row.cpu_limit
+        cpu_usage += row.cpu_usage
+        mem_request += row.mem_request
+        mem_limit += row.mem_limit
+        mem_usage += row.mem_usage
+        storage_request += row.storage_request
+        storage_limit += row.storage_limit
+
+    # Percents come from the totals rather than summing per-row percents
+    cpu_scale = _percent_scale(total_capacity["cpu"])
+    mem_scale = _percent_scale(total_capacity["memory"])
+    storage_scale = _percent_scale(total_capacity["storage"])
 
     total_row = TableRow(
         namespace="Total Used",
-        cpu_request=total_cpu_request,
-        cpu_request_percent=sum(row.cpu_request_percent for row in table),
-        cpu_limit=total_cpu_limit,
-        cpu_limit_percent=sum(row.cpu_limit_percent for row in table),
-        cpu_usage=total_cpu_usage,
-        cpu_usage_percent=sum(row.cpu_usage_percent for row in table),
-        mem_request=total_mem_request,
-        mem_request_percent=sum(row.mem_request_percent for row in table),
-        mem_limit=total_mem_limit,
-        mem_limit_percent=sum(row.mem_limit_percent for row in table),
-        mem_usage=total_mem_usage,
-        mem_usage_percent=sum(row.mem_usage_percent for row in table),
-        storage_request=total_storage_request,
-        storage_request_percent=sum(row.storage_request_percent for row in table),
-        storage_limit=total_storage_limit,
-        storage_limit_percent=sum(row.storage_limit_percent for row in table),
+        cpu_request=cpu_request,
+        cpu_request_percent=cpu_request * cpu_scale,
+        cpu_limit=cpu_limit,
+        cpu_limit_percent=cpu_limit * cpu_scale,
+        cpu_usage=cpu_usage,
+        cpu_usage_percent=cpu_usage * cpu_scale,
+        mem_request=mem_request,
+        mem_request_percent=mem_request * mem_scale,
+        mem_limit=mem_limit,
+        mem_limit_percent=mem_limit * mem_scale,
+        mem_usage=mem_usage,
+        mem_usage_percent=mem_usage * mem_scale,
+        storage_request=storage_request,
+        storage_request_percent=storage_request * storage_scale,
+        storage_limit=storage_limit,
+        storage_limit_percent=storage_limit * storage_scale,
     )
 
     table.append(total_row)
@@ -390,19 +440,58 @@ def add_capacity_row(
     return table
 
 
-def calc_severity(percent: float, colorize: bool) -> Text:
+# Green->red gradient, one style per whole percent
+_SEVERITY_STYLES = [
+    Style(
+        color=Color.from_triplet(
+            blend_rgb(
+                parse_rgb_hex("00ff00"),
+                parse_rgb_hex("ff0000"),
+                cross_fade=percent / 100,
+            ),
+        ),
+    )
+    for percent in range(101)
+]
+
+
+def format_percent(percent: float) -> Text:
+    return Text(f"{percent:.2f}")
+
+
+def calc_severity(percent: float) -> Text:
     # Turns percent into green->red gradient
-    text = f"{percent:.2f}"
-    if not colorize:
-        return Text(text)
-
-    triplet = blend_rgb(
-        parse_rgb_hex("00ff00"),
-        parse_rgb_hex("ff0000"),
-        cross_fade=percent / 100,
+    return Text(
+        f"{percent:.2f}",
+        style=_SEVERITY_STYLES[max(0, min(100, round(percent)))],
+    )
+
+
+def pretty_row(row: TableRow) -> tuple[Text, ...]:
+    """Renders one table row into rich cells."""
+    # The capacity row is the 100% reference, so it is never colorized
+    is_capacity = row.namespace == "Total Capacity"
+    percent = format_percent if is_capacity else calc_severity
+
+    return (
+        Text(row.namespace),
+        format_cpu(row.cpu_request),
+        percent(row.cpu_request_percent),
+        format_cpu(row.cpu_limit),
+        percent(row.cpu_limit_percent),
+        format_cpu(row.cpu_usage),
+        percent(row.cpu_usage_percent),
+        format_mem(row.mem_request),
+        percent(row.mem_request_percent),
+        format_mem(row.mem_limit),
+        percent(row.mem_limit_percent),
+        format_mem(row.mem_usage),
+        percent(row.mem_usage_percent),
+        format_mem(row.storage_request),
+        percent(row.storage_request_percent),
+        format_mem(row.storage_limit),
+        percent(row.storage_limit_percent),
     )
-    color = Color(text, ColorType.TRUECOLOR, triplet=triplet)
-    return Text(text, style=Style(color=color))
 
 
 def print_table(table: list[TableRow]) -> None:
@@ -426,34 +515,15 @@ def print_table(table: list[TableRow]) -> None:
         Column("%", justify="right"),
     ]
 
+    # Build every cell up front; rich only measures columns when rendering
+    rows = [pretty_row(row) for row in table]
+
     rich_table = Table(*headers, box=box.SIMPLE)
-    for idx, row in enumerate(table):
-        if idx == len(table) - 2:
+    section_idx = len(rows) - 2
+    for idx, cells in enumerate(rows):
+        if idx == section_idx:
             rich_table.add_section()
-
-        pretty_row: list[Text] = [
-            Text(row.namespace),
-            format_cpu(row.cpu_request),
-            calc_severity(row.cpu_request_percent, row.namespace != "Total Capacity"),
-            format_cpu(row.cpu_limit),
-            calc_severity(row.cpu_limit_percent, row.namespace != "Total Capacity"),
-            format_cpu(row.cpu_usage),
-            calc_severity(row.cpu_usage_percent, row.namespace != "Total Capacity"),
-            format_mem(row.mem_request),
-            calc_severity(row.mem_request_percent, row.namespace != "Total Capacity"),
-            format_mem(row.mem_limit),
-            calc_severity(row.mem_limit_percent, row.namespace != "Total Capacity"),
-            format_mem(row.mem_usage),
-            calc_severity(row.mem_usage_percent, row.namespace != "Total Capacity"),
-            format_mem(row.storage_request),
-            calc_severity(
-                row.storage_request_percent,
-                row.namespace != "Total Capacity",
-            ),
-            format_mem(row.storage_limit),
-            calc_severity(row.storage_limit_percent, row.namespace != "Total Capacity"),
-        ]
-        rich_table.add_row(*pretty_row)
+        rich_table.add_row(*cells)
 
     with Console() as console:
         console.print(rich_table)
@@ -462,51 +532,9 @@ def print_table(table: list[TableRow]) -> None:
 def print_csv(table: list[TableRow]) -> None:
     writer = csv.writer(sys.stdout)
 
-    # Print header
-    headers = [
-        "namespace",
-        "cpu_request",
-        "cpu_request_percent",
-        "cpu_limit",
-        "cpu_limit_percent",
-        "cpu_usage",
-        "cpu_usage_percent",
-        "mem_request",
-        "mem_request_percent",
-        "mem_limit",
-        "mem_limit_percent",
-        "mem_usage",
-        "mem_usage_percent",
-        "storage_request",
-        "storage_request_percent",
-        "storage_limit",
-        "storage_limit_percent",
-    ]
-    writer.writerow(headers)
-
-    # Print each row of the table
-    for row in table:
-        writer.writerow(
-            [
-                row.namespace,
-                row.cpu_request,
-                row.cpu_request_percent,
-                row.cpu_limit,
-                row.cpu_limit_percent,
-                row.cpu_usage,
-                row.cpu_usage_percent,
-                row.mem_request,
-                row.mem_request_percent,
-                row.mem_limit,
-                row.mem_limit_percent,
-                row.mem_usage,
-                row.mem_usage_percent,
-                row.storage_request,
-                row.storage_request_percent,
-                row.storage_limit,
-                row.storage_limit_percent,
-            ],
-        )
+    # TableRow fields are already in column order, so rows are written as-is
+    writer.writerow(TableRow._fields)
+    writer.writerows(table)
 
 
 def parse_args() -> argparse.Namespace:
@@ -547,9 +575,41 @@ def parse_args() -> argparse.Namespace:
         ],
         help="sort by specified field",
     )
+    parser.add_argument(
+        "--source",
+        choices=["api", "ksm"],
+        default="api",
+        help="read pod resources and node capacity from the API or kube-state-metrics",
+    )
+    parser.add_argument(
+        "--ksm-service",
+        default="kube-system/kube-state-metrics:http-metrics",
+        help="kube-state-metrics service as namespace/name[:port]",
+    )
     return parser.parse_args()
 
 
+def fetch_resources(
+    v1: client.CoreV1Api,
+    args: argparse.Namespace,
+    executor: ThreadPoolExecutor,
+) -> tuple[dict[str, dict[str, int]], dict[str, int]]:
+    """Returns pod resources and cluster capacity from the selected source."""
+    if args.source == "ksm":
+        try:
+            return get_ksm_summary(v1, args.ksm_service)
+        except (ApiException, HTTPError) as e:
+            reason = e.reason if isinstance(e, ApiException) else e
+            print(
+                f"kube-state-metrics unavailable ({reason}), falling back to the API",
+                file=sys.stderr,
+            )
+
+    resources_future = executor.submit(get_summary_pod_resources, v1)
+    capacity_future = executor.submit(get_cluster_capacity, v1)
+    return resources_future.result(), capacity_future.result()
+
+
 def main() -> None:
     args = parse_args()
 
@@ -557,12 +617,22 @@ def main() -> None:
         print_version()
         sys.exit()
 
-    resources = get_summary_pod_resources()
-    metrics = get_pod_metrics()
-    total_capacity = get_cluster_capacity()
+    # Load the kubeconfig once and share one connection pool between requests
+    config.load_kube_config()
+    api_client = client.ApiClient()
+    # Large list responses compress well; urllib3 decodes them transparently
+    api_client.set_default_header("Accept-Encoding", "gzip")
+    v1 = client.CoreV1Api(api_client)
+    custom = client.CustomObjectsApi(api_client)
+
+    # The requests are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        metrics_future = executor.submit(get_pod_metrics, custom)
+        resources, total_capacity = fetch_resources(v1, args, executor)
+        metrics = metrics_future.result()
     table = build_table(resources, metrics, total_capacity)
     table = sort_table(table, args.sort_by)
-    table = add_total_row(table)
+    table = add_total_row(table, total_capacity)
     table = add_capacity_row(table, total_capacity)
     if args.csv:
         print_csv(table)